@@ -39,11 +39,16 @@ pub fn runList(allocator: std.mem.Allocator, details: bool) !void {
 
     const root = parsed.value.object;
 
+    // Collect the listing in memory and write it out in one go
+    var out_buf: std.ArrayList(u8) = .empty;
+    defer out_buf.deinit(allocator);
+    const out = out_buf.writer(allocator);
+
     // Connected muxes
     if (root.get("clients")) |clients_val| {
         const clients = clients_val.array;
         if (clients.items.len > 0) {
-            print("Connected muxes: {d}\n", .{clients.items.len});
+            try out.print("Connected muxes: {d}\n", .{clients.items.len});
             for (clients.items) |client_val| {
                 const c = client_val.object;
                 const id = c.get("id").?.integer;
@@ -52,13 +57,13 @@ pub fn runList(allocator: std.mem.Allocator, details: bool) !void {
                 const sid = if (c.get("session_id")) |s| s.string else null;
 
                 if (sid) |session_id| {
-                    print("  {s} [{s}] (mux #{d}, {d} panes)\n", .{ name, session_id[0..8], id, panes.items.len });
+                    try out.print("  {s} [{s}] (mux #{d}, {d} panes)\n", .{ name, session_id[0..8], id, panes.items.len });
                 } else {
-                    print("  {s} (mux #{d}, {d} panes)\n", .{ name, id, panes.items.len });
+                    try out.print("  {s} (mux #{d}, {d} panes)\n", .{ name, id, panes.items.len });
                 }
 
                 if (c.get("mux_state")) |mux_state_val| {
-                    printMuxTree(allocator, mux_state_val.string, "    ");
+                    try printMuxTree(allocator, out, mux_state_val.string, "    ");
                 }
             }
         }
@@ -68,17 +73,17 @@ pub fn runList(allocator: std.mem.Allocator, details: bool) !void {
     if (root.get("detached_sessions")) |sessions_val| {
         const sessions = sessions_val.array;
         if (sessions.items.len > 0) {
-            print("\nDetached sessions: {d}\n", .{sessions.items.len});
+            try out.print("\nDetached sessions: {d}\n", .{sessions.items.len});
             for (sessions.items) |sess_val| {
                 const s = sess_val.object;
                 const sid = s.get("session_id").?.string;
                 const pane_count = s.get("pane_count").?.integer;
                 const name = if (s.get("session_name")) |n| n.string else "unknown";
 
-                print("  {s} [{s}] {d} panes - reattach: hexa mux attach {s}\n", .{ name, sid[0..8], pane_count, name });
+                try out.print("  {s} [{s}] {d} panes - reattach: hexa mux attach {s}\n", .{ name, sid[0..8], pane_count, name });
 
                 if (s.get("mux_state")) |mux_state_val| {
-                    printMuxTree(allocator, mux_state_val.string, "    ");
+                    try printMuxTree(allocator, out, mux_state_val.string, "    ");
                 }
             }
         }
@@ -88,12 +93,12 @@ pub fn runList(allocator: std.mem.Allocator, details: bool) !void {
     if (root.get("orphaned")) |orphaned_val| {
         const orphaned = orphaned_val.array;
         if (orphaned.items.len > 0) {
-            print("\nOrphaned panes: {d}\n", .{orphaned.items.len});
+            try out.print("\nOrphaned panes: {d}\n", .{orphaned.items.len});
             for (orphaned.items) |pane_val| {
                 const p = pane_val.object;
                 const uuid = p.get("uuid").?.string;
                 const pid = p.get("pid").?.integer;
-                print("  [{s}] pid={d}\n", .{ uuid[0..8], pid });
+                try out.print("  [{s}] pid={d}\n", .{ uuid[0..8], pid });
             }
         }
     }
@@ -102,22 +107,24 @@ pub fn runList(allocator: std.mem.Allocator, details: bool) !void {
     if (root.get("sticky")) |sticky_val| {
         const sticky = sticky_val.array;
         if (sticky.items.len > 0) {
-            print("\nSticky panes: {d}\n", .{sticky.items.len});
+            try out.print("\nSticky panes: {d}\n", .{sticky.items.len});
             for (sticky.items) |pane_val| {
                 const p = pane_val.object;
                 const uuid = p.get("uuid").?.string;
                 const pid = p.get("pid").?.integer;
-                print("  [{s}] pid={d}", .{ uuid[0..8], pid });
+                try out.print("  [{s}] pid={d}", .{ uuid[0..8], pid });
                 if (p.get("pwd")) |pwd| {
-                    print(" pwd={s}", .{pwd.string});
+                    try out.print(" pwd={s}", .{pwd.string});
                 }
                 if (p.get("key")) |key| {
-                    print(" key={s}", .{key.string});
+                    try out.print(" key={s}", .{key.string});
                 }
-                print("\n", .{});
+                try out.writeAll("\n");
             }
         }
     }
+
+    try std.fs.File.stderr().writeAll(out_buf.items);
 }
 
 pub fn runInfo(allocator: std.mem.Allocator, uuid_arg: []const u8, show_creator: bool, show_last: bool) !void {
@@ -373,7 +380,7 @@ pub fn runNotify(allocator: std.mem.Allocator, uuid: []const u8, creator: bool,
     }
 }
 
-pub fn printMuxTree(allocator: std.mem.Allocator, json: []const u8, indent: []const u8) void {
+pub fn printMuxTree(allocator: std.mem.Allocator, out: anytype, json: []const u8, indent: []const u8) !void {
     const parsed = std.json.parseFromSlice(std.json.Value, allocator, json, .{}) catch return;
     defer parsed.deinit();
 
@@ -389,7 +396,7 @@ pub fn printMuxTree(allocator: std.mem.Allocator, json: []const u8, indent: []co
             const name = if (tab.get("name")) |n| n.string else "tab";
             const tab_uuid = if (tab.get("uuid")) |u| u.string else "?";
             const marker = if (ti == active) "*" else " ";
-            print("{s}{s} Tab: {s} [{s}]\n", .{ indent, marker, name, tab_uuid[0..@min(8, tab_uuid.len)] });
+            try out.print("{s}{s} Tab: {s} [{s}]\n", .{ indent, marker, name, tab_uuid[0..@min(8, tab_uuid.len)] });
 
             if (tab.get("splits")) |splits_val| {
                 for (splits_val.array.items) |split_val| {
@@ -398,7 +405,7 @@ pub fn printMuxTree(allocator: std.mem.Allocator, json: []const u8, indent: []co
                     const pid = if (split.get("id")) |id| @as(i64, id.integer) else 0;
                     const focused = if (split.get("focused")) |f| f.bool else false;
                     const fm = if (focused) ">" else " ";
-                    print("{s}  {s} Split {d} [{s}]\n", .{ indent, fm, pid, uuid[0..@min(8, uuid.len)] });
+                    try out.print("{s}  {s} Split {d} [{s}]\n", .{ indent, fm, pid, uuid[0..@min(8, uuid.len)] });
                 }
             }
 
@@ -409,7 +416,7 @@ pub fn printMuxTree(allocator: std.mem.Allocator, json: []const u8, indent: []co
                         const uuid = if (float.get("uuid")) |u| u.string else "?";
                         const visible = if (float.get("visible")) |v| v.bool else false;
                         const vm = if (visible) "*" else " ";
-                        print("{s}  {s} Float {d} [{s}]\n", .{ indent, vm, fi, uuid[0..@min(8, uuid.len)] });
+                        try out.print("{s}  {s} Float {d} [{s}]\n", .{ indent, vm, fi, uuid[0..@min(8, uuid.len)] });
                     }
                 }
             }
@@ -426,14 +433,14 @@ pub fn printMuxTree(allocator: std.mem.Allocator, json: []const u8, indent: []co
     }
 
     if (has_global_floats) {
-        print("{s}Floats (global):\n", .{indent});
+        try out.print("{s}Floats (global):\n", .{indent});
         for (floats_arr, 0..) |float_val, i| {
             const float = float_val.object;
             if (float.get("parent_tab") == null) {
                 const uuid = if (float.get("uuid")) |u| u.string else "?";
                 const visible = if (float.get("visible")) |v| v.bool else false;
                 const vm = if (visible) "*" else " ";
-                print("{s}  {s} Float {d} [{s}]\n", .{ indent, vm, i, uuid[0..@min(8, uuid.len)] });
+                try out.print("{s}  {s} Float {d} [{s}]\n", .{ indent, vm, i, uuid[0..@min(8, uuid.len)] });
             }
         }
     }
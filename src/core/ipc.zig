@@ -135,29 +135,50 @@ pub const Connection = struct {
 
     /// Send a line (data + newline)
     pub fn sendLine(self: *Connection, data: []const u8) !void {
-        try self.send(data);
-        try self.send("\n");
+        // Gather data and newline into one writev so each message is a
+        // single syscall; fall back to send() for any partial remainder.
+        const iovecs = [_]posix.iovec_const{
+            .{ .base = data.ptr, .len = data.len },
+            .{ .base = "\n", .len = 1 },
+        };
+        const sent = try posix.writev(self.fd, &iovecs);
+        if (sent == 0) return error.ConnectionClosed;
+        if (sent < data.len) {
+            try self.send(data[sent..]);
+            try self.send("\n");
+        } else if (sent == data.len) {
+            try self.send("\n");
+        }
     }
 
     /// Receive a line (up to newline, newline not included in result)
     pub fn recvLine(self: *Connection, buf: []u8) !?[]const u8 {
         var i: usize = 0;
         while (i < buf.len) {
-            const n = posix.read(self.fd, buf[i .. i + 1]) catch |err| {
+            // Peek at everything queued, then consume only through the newline
+            // so following messages stay in the socket for the next call.
+            const peeked = posix.recv(self.fd, buf[i..], posix.MSG.PEEK) catch |err| {
                 if (err == error.WouldBlock) {
                     if (i == 0) return null;
                     continue;
                 }
                 return err;
             };
-            if (n == 0) {
+            if (peeked == 0) {
                 if (i == 0) return null;
                 return buf[0..i];
             }
-            if (buf[i] == '\n') {
+            const newline = std.mem.indexOfScalar(u8, buf[i .. i + peeked], '\n');
+            const want = if (newline) |nl| nl + 1 else peeked;
+            const n = try posix.read(self.fd, buf[i .. i + want]);
+            if (n == 0) {
+                if (i == 0) return null;
                 return buf[0..i];
             }
-            i += 1;
+            if (newline != null and n == want) {
+                return buf[0 .. i + n - 1];
+            }
+            i += n;
         }
         return buf[0..i];
     }
@@ -248,6 +269,31 @@ pub const Connection = struct {
     }
 };
 
+/// JSON escape sequence for each byte, or null if it is copied verbatim
+const json_escapes = blk: {
+    var table = [_]?[]const u8{null} ** 256;
+    table['"'] = "\\\"";
+    table['\\'] = "\\\\";
+    table['\n'] = "\\n";
+    table['\r'] = "\\r";
+    table['\t'] = "\\t";
+    break :blk table;
+};
+
+/// Write `str` as the contents of a JSON string (without the surrounding
+/// quotes). Runs of bytes that need no escaping are copied in one write.
+pub fn writeJsonEscaped(writer: anytype, str: []const u8) !void {
+    var start: usize = 0;
+    for (str, 0..) |byte, i| {
+        if (json_escapes[byte]) |esc| {
+            try writer.writeAll(str[start..i]);
+            try writer.writeAll(esc);
+            start = i + 1;
+        }
+    }
+    try writer.writeAll(str[start..]);
+}
+
 /// SCM_RIGHTS constant for passing file descriptors
 const SCM_RIGHTS: c_int = 1;
 
@@ -204,12 +204,15 @@ pub const Pty = struct {
             // Still running - send SIGHUP then SIGTERM
             _ = std.c.kill(self.child_pid, std.c.SIG.HUP);
 
-            // Brief wait then check again
-            std.Thread.sleep(10 * std.time.ns_per_ms);
-            const result2 = posix.waitpid(self.child_pid, posix.W.NOHANG);
-            if (result2.pid != 0) {
-                self.child_reaped = true;
-                return;
+            // Brief wait then check again: poll every 1ms (up to 10ms) so a
+            // shell that exits on SIGHUP is reaped without the full delay
+            for (0..10) |_| {
+                std.Thread.sleep(std.time.ns_per_ms);
+                const result2 = posix.waitpid(self.child_pid, posix.W.NOHANG);
+                if (result2.pid != 0) {
+                    self.child_reaped = true;
+                    return;
+                }
             }
 
             // Force kill if still alive
@@ -213,13 +213,7 @@ pub fn drawFloatingBorder(
     const vertical: u21 = if (style) |s| s.vertical else 0x2502;
 
     // Clear the interior with spaces first
-    for (1..h -| 1) |row| {
-        for (1..w -| 1) |col| {
-            renderer.setCell(x + @as(u16, @intCast(col)), y + @as(u16, @intCast(row)), .{
-                .char = ' ',
-            });
-        }
-    }
+    renderer.fillRect(x + 1, y + 1, w -| 2, h -| 2, .{ .char = ' ' });
 
     // Top-left corner
     renderer.setCell(x, y, .{ .char = top_left, .fg = fg, .bold = bold });
@@ -1173,6 +1173,9 @@ fn runMainLoop(state: *State) !void {
     const orig_termios = try terminal.enableRawMode(posix.STDIN_FILENO);
     defer terminal.disableRawMode(posix.STDIN_FILENO, orig_termios) catch {};
 
+    // Resizes are signalled via SIGWINCH instead of polling ioctl every loop
+    terminal.watchResize();
+
     // Enter alternate screen and reset it
     const stdout = std.fs.File.stdout();
     // Sequence:
@@ -1208,7 +1211,7 @@ fn runMainLoop(state: *State) !void {
         state.skip_dead_check = false;
 
         // Check for terminal resize
-        {
+        if (terminal.takeResize()) {
             const new_size = terminal.getTermSize();
             if (new_size.cols != state.term_width or new_size.rows != state.term_height) {
                 state.term_width = new_size.cols;
@@ -38,13 +38,7 @@ pub fn drawConfirmInBounds(renderer: *Renderer, confirm: *pop.Confirm, cfg: pop.
     const inner_x = box_x + 1;
 
     // Draw box background
-    var y: u16 = box_y;
-    while (y < box_y + box_height) : (y += 1) {
-        var x: u16 = box_x;
-        while (x < box_x + box_width) : (x += 1) {
-            renderer.setCell(x, y, .{ .char = ' ', .fg = fg, .bg = bg });
-        }
-    }
+    renderer.fillRect(box_x, box_y, box_width, box_height, .{ .char = ' ', .fg = fg, .bg = bg });
 
     // Top border
     renderer.setCell(box_x, box_y, .{ .char = '┌', .fg = fg, .bg = bg });
@@ -63,7 +57,7 @@ pub fn drawConfirmInBounds(renderer: *Renderer, confirm: *pop.Confirm, cfg: pop.
     renderer.setCell(box_x + box_width - 1, box_y + box_height - 1, .{ .char = '┘', .fg = fg, .bg = bg });
 
     // Side borders
-    y = box_y + 1;
+    var y: u16 = box_y + 1;
     while (y < box_y + box_height - 1) : (y += 1) {
         renderer.setCell(box_x, y, .{ .char = '│', .fg = fg, .bg = bg });
         renderer.setCell(box_x + box_width - 1, y, .{ .char = '│', .fg = fg, .bg = bg });
@@ -146,13 +140,7 @@ pub fn drawPickerInBounds(renderer: *Renderer, picker: *pop.Picker, cfg: pop.Cho
     const highlight_bg: render.Color = .{ .palette = cfg.highlight_bg };
 
     // Draw box background
-    var y: u16 = box_y;
-    while (y < box_y + box_height) : (y += 1) {
-        var x: u16 = box_x;
-        while (x < box_x + box_width) : (x += 1) {
-            renderer.setCell(x, y, .{ .char = ' ', .fg = fg, .bg = bg });
-        }
-    }
+    renderer.fillRect(box_x, box_y, box_width, box_height, .{ .char = ' ', .fg = fg, .bg = bg });
 
     // Top border with optional title
     renderer.setCell(box_x, box_y, .{ .char = '┌', .fg = fg, .bg = bg });
@@ -185,7 +173,7 @@ pub fn drawPickerInBounds(renderer: *Renderer, picker: *pop.Picker, cfg: pop.Cho
     renderer.setCell(box_x + box_width - 1, box_y + box_height - 1, .{ .char = '┘', .fg = fg, .bg = bg });
 
     // Side borders
-    y = box_y + 1;
+    var y: u16 = box_y + 1;
     while (y < box_y + box_height - 1) : (y += 1) {
         renderer.setCell(box_x, y, .{ .char = '│', .fg = fg, .bg = bg });
         renderer.setCell(box_x + box_width - 1, y, .{ .char = '│', .fg = fg, .bg = bg });
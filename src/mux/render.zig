@@ -2,6 +2,7 @@ const std = @import("std");
 const ghostty = @import("ghostty-vt");
 const pagepkg = ghostty.page;
 const colorpkg = ghostty.color;
+const sgr_palette = @import("shp").palette;
 
 /// Represents a single rendered cell with all its attributes
 pub const Cell = struct {
@@ -102,6 +103,12 @@ pub const CellBuffer = struct {
         return self.cells[idx];
     }
 
+    /// Cells of row `y` as a contiguous slice
+    pub fn row(self: *const CellBuffer, y: u16) []const Cell {
+        const start = @as(usize, y) * @as(usize, self.width);
+        return self.cells[start .. start + self.width];
+    }
+
     pub fn clear(self: *CellBuffer) void {
         @memset(self.cells, Cell{});
     }
@@ -117,23 +124,34 @@ pub const CellBuffer = struct {
     }
 };
 
-// ESC character constant
-const ESC: u8 = 0x1B;
+// Control Sequence Introducer (ESC [)
+const CSI = "\x1b[";
+
+/// Write a CSI sequence (ESC [) followed by the given suffix.
+/// The suffix is comptime so the full sequence is pre-encoded as one literal.
+fn writeCSI(output: *std.ArrayList(u8), allocator: std.mem.Allocator, comptime suffix: []const u8) !void {
+    try output.appendSlice(allocator, CSI ++ suffix);
+}
 
-/// Write a CSI sequence (ESC [) followed by the given suffix
-fn writeCSI(output: *std.ArrayList(u8), allocator: std.mem.Allocator, suffix: []const u8) !void {
-    try output.append(allocator, ESC);
-    try output.append(allocator, '[');
-    try output.appendSlice(allocator, suffix);
+/// Append the decimal digits of `value` directly to the output buffer
+fn appendDecimal(output: *std.ArrayList(u8), allocator: std.mem.Allocator, value: usize) !void {
+    var digits: [20]u8 = undefined;
+    var i: usize = digits.len;
+    var v = value;
+    while (true) {
+        i -= 1;
+        digits[i] = '0' + @as(u8, @intCast(v % 10));
+        v /= 10;
+        if (v == 0) break;
+    }
+    try output.appendSlice(allocator, digits[i..]);
 }
 
-/// Write a CSI sequence with formatted parameters
-fn writeCSIFmt(output: *std.ArrayList(u8), allocator: std.mem.Allocator, buf: []u8, comptime fmt: []const u8, args: anytype) !void {
-    // Format first, THEN write - prevents partial sequences on format failure
-    const formatted = std.fmt.bufPrint(buf, fmt, args) catch return;
-    try output.append(allocator, ESC);
-    try output.append(allocator, '[');
-    try output.appendSlice(allocator, formatted);
+/// Write a CSI sequence with one numeric parameter, e.g. ESC [ n C
+fn writeCSINum(output: *std.ArrayList(u8), allocator: std.mem.Allocator, n: usize, comptime final: []const u8) !void {
+    try output.appendSlice(allocator, CSI);
+    try appendDecimal(output, allocator, n);
+    try output.appendSlice(allocator, final);
 }
 
 /// Differential renderer that tracks state and only emits changed cells
@@ -186,6 +204,19 @@ pub const Renderer = struct {
         self.next.get(x, y).* = cell;
     }
 
+    /// Fill a rectangle in the next frame buffer with the same cell,
+    /// one row slice at a time (clipped to the buffer like `setCell`)
+    pub fn fillRect(self: *Renderer, x: u16, y: u16, w: u16, h: u16, cell: Cell) void {
+        if (x >= self.next.width or y >= self.next.height) return;
+        const stride: usize = self.next.width;
+        const x_end = @min(@as(usize, x) + w, stride);
+        const y_end = @min(@as(usize, y) + h, @as(usize, self.next.height));
+        for (@as(usize, y)..y_end) |yi| {
+            const start = yi * stride;
+            @memset(self.next.cells[start + x .. start + x_end], cell);
+        }
+    }
+
     /// Draw a pane's viewport content into the frame buffer at the given offset.
     ///
     /// This renders from ghostty's `RenderState` snapshot, which is safe to read
@@ -278,22 +309,20 @@ pub const Renderer = struct {
         const width = self.next.width;
         const height = self.next.height;
 
-        // Fast path: if nothing changed, emit nothing.
+        // Fast path: find the first changed row; if nothing changed, emit nothing.
+        // Rows above it are known to be clean, so the diff loop starts there.
+        var first_row: usize = 0;
         if (!force_full) {
-            var changed = false;
+            first_row = height;
             for (0..height) |yi| {
                 const y: u16 = @intCast(yi);
-                for (0..width) |xi| {
-                    const x: u16 = @intCast(xi);
-                    if (!self.current.getConst(x, y).eql(self.next.getConst(x, y))) {
-                        changed = true;
-                        break;
-                    }
+                if (firstDiff(self.current.row(y), self.next.row(y)) != null) {
+                    first_row = yi;
+                    break;
                 }
-                if (changed) break;
             }
 
-            if (!changed) {
+            if (first_row == height) {
                 std.mem.swap(CellBuffer, &self.current, &self.next);
                 return self.output.items;
             }
@@ -323,39 +352,23 @@ pub const Renderer = struct {
         self.current_strikethrough = false;
         self.current_inverse = false;
 
-        // Use a fixed buffer for building escape sequences to ensure atomic writes
-        var seq_buf: [64]u8 = undefined;
-
-        for (0..height) |yi| {
+        for (first_row..height) |yi| {
             const y: u16 = @intCast(yi);
 
             var start_x: usize = 0;
             if (!force_full) {
-                // Find the first differing cell in this row.
-                start_x = width;
-                for (0..width) |xi| {
-                    const old = self.current.getConst(@intCast(xi), y);
-                    const new = self.next.getConst(@intCast(xi), y);
-                    if (!old.eql(new)) {
-                        start_x = xi;
-                        break;
-                    }
-                }
-
-                if (start_x == width) {
-                    // No changes in this row.
-                    continue;
-                }
+                // Find the first differing cell in this row (skip clean rows).
+                start_x = firstDiff(self.current.row(y), self.next.row(y)) orelse continue;
             }
 
             // Position cursor at start of the row.
-            try writeCSIFmt(&self.output, self.allocator, &seq_buf, "{d};1H", .{y + 1});
+            try writeCSINum(&self.output, self.allocator, @as(usize, y) + 1, ";1H");
 
             var cursor_x: usize = 0;
 
             // Skip to the first changed cell.
             if (start_x > 0) {
-                try writeCSIFmt(&self.output, self.allocator, &seq_buf, "{d}C", .{start_x});
+                try writeCSINum(&self.output, self.allocator, start_x, "C");
                 cursor_x = start_x;
             }
 
@@ -364,25 +377,21 @@ pub const Renderer = struct {
                 const old = self.current.getConst(@intCast(xi), y);
                 const new = self.next.getConst(@intCast(xi), y);
 
-                if (!force_full and old.eql(new)) {
+                // Wide-character spacer tails advance the cursor but are never
+                // drawn, so fold them into the pending skip like clean cells;
+                // runs of them then cost one cursor move (or none at row end).
+                if (new.char == 0 or (!force_full and old.eql(new))) {
                     pending_skip += 1;
                     continue;
                 }
 
                 if (pending_skip > 0) {
-                    try writeCSIFmt(&self.output, self.allocator, &seq_buf, "{d}C", .{pending_skip});
+                    try writeCSINum(&self.output, self.allocator, pending_skip, "C");
                     cursor_x += pending_skip;
                     pending_skip = 0;
                 }
 
-                // Wide-character spacer tail: advance cursor but don't overwrite.
-                if (new.char == 0) {
-                    try writeCSI(&self.output, self.allocator, "1C");
-                    cursor_x += 1;
-                    continue;
-                }
-
-                try self.emitStyleChanges(&seq_buf, new);
+                try self.emitStyleChanges(new);
                 try self.emitChar(new.char);
                 cursor_x += 1;
             }
@@ -407,7 +416,7 @@ pub const Renderer = struct {
 
                     if (tail_uniform) {
                         // Make sure the SGR state matches the blank tail.
-                        try self.emitStyleChanges(&seq_buf, base);
+                        try self.emitStyleChanges(base);
                         try writeCSI(&self.output, self.allocator, "K");
                     }
                 }
@@ -424,7 +433,15 @@ pub const Renderer = struct {
         return self.output.items;
     }
 
-    fn emitStyleChanges(self: *Renderer, seq_buf: *[64]u8, cell: Cell) !void {
+    /// Index of the first cell that differs between two rows, if any
+    fn firstDiff(old: []const Cell, new: []const Cell) ?usize {
+        for (old, new, 0..) |o, n, xi| {
+            if (!o.eql(n)) return xi;
+        }
+        return null;
+    }
+
+    fn emitStyleChanges(self: *Renderer, cell: Cell) !void {
         // Check if we need a full reset
         const need_reset = (self.current_bold and !cell.bold) or
             (self.current_italic and !cell.italic) or
@@ -433,8 +450,14 @@ pub const Renderer = struct {
             (self.current_strikethrough and !cell.strikethrough) or
             (self.current_inverse and !cell.inverse);
 
+        // All changes are collected into a single SGR sequence (ESC [ a;b;c m)
+        // instead of one escape per attribute.
+        const seq_start = self.output.items.len;
+        try self.output.appendSlice(self.allocator, CSI);
+        const params_start = self.output.items.len;
+
         if (need_reset) {
-            try writeCSI(&self.output, self.allocator, "0m");
+            try self.appendSgrParam(params_start, "0");
             self.current_fg = .none;
             self.current_bg = .none;
             self.current_bold = false;
@@ -447,48 +470,48 @@ pub const Renderer = struct {
 
         // Emit attribute changes
         if (cell.bold and !self.current_bold) {
-            try writeCSI(&self.output, self.allocator, "1m");
+            try self.appendSgrParam(params_start, "1");
             self.current_bold = true;
         }
 
         if (cell.faint and !self.current_faint) {
-            try writeCSI(&self.output, self.allocator, "2m");
+            try self.appendSgrParam(params_start, "2");
             self.current_faint = true;
         }
 
         if (cell.italic and !self.current_italic) {
-            try writeCSI(&self.output, self.allocator, "3m");
+            try self.appendSgrParam(params_start, "3");
             self.current_italic = true;
         }
 
         if (cell.underline != self.current_underline) {
             switch (cell.underline) {
                 .none => {}, // handled by reset
-                .single => try writeCSI(&self.output, self.allocator, "4m"),
-                .double => try writeCSI(&self.output, self.allocator, "4:2m"),
-                .curly => try writeCSI(&self.output, self.allocator, "4:3m"),
-                .dotted => try writeCSI(&self.output, self.allocator, "4:4m"),
-                .dashed => try writeCSI(&self.output, self.allocator, "4:5m"),
+                .single => try self.appendSgrParam(params_start, "4"),
+                .double => try self.appendSgrParam(params_start, "4:2"),
+                .curly => try self.appendSgrParam(params_start, "4:3"),
+                .dotted => try self.appendSgrParam(params_start, "4:4"),
+                .dashed => try self.appendSgrParam(params_start, "4:5"),
             }
             self.current_underline = cell.underline;
         }
 
         if (cell.inverse and !self.current_inverse) {
-            try writeCSI(&self.output, self.allocator, "7m");
+            try self.appendSgrParam(params_start, "7");
             self.current_inverse = true;
         }
 
         if (cell.strikethrough and !self.current_strikethrough) {
-            try writeCSI(&self.output, self.allocator, "9m");
+            try self.appendSgrParam(params_start, "9");
             self.current_strikethrough = true;
         }
 
         // Emit foreground color change
         if (!cell.fg.eql(self.current_fg)) {
             switch (cell.fg) {
-                .none => try writeCSI(&self.output, self.allocator, "39m"),
-                .palette => |idx| try writeCSIFmt(&self.output, self.allocator, seq_buf, "38;5;{d}m", .{idx}),
-                .rgb => |rgb| try writeCSIFmt(&self.output, self.allocator, seq_buf, "38;2;{d};{d};{d}m", .{ rgb.r, rgb.g, rgb.b }),
+                .none => try self.appendSgrParam(params_start, "39"),
+                .palette => |idx| try self.appendSgrParam(params_start, sgr_palette.fg256[idx]),
+                .rgb => |rgb| try self.appendSgrRgb(params_start, "38;2;", rgb),
             }
             self.current_fg = cell.fg;
         }
@@ -496,12 +519,35 @@ pub const Renderer = struct {
         // Emit background color change
         if (!cell.bg.eql(self.current_bg)) {
             switch (cell.bg) {
-                .none => try writeCSI(&self.output, self.allocator, "49m"),
-                .palette => |idx| try writeCSIFmt(&self.output, self.allocator, seq_buf, "48;5;{d}m", .{idx}),
-                .rgb => |rgb| try writeCSIFmt(&self.output, self.allocator, seq_buf, "48;2;{d};{d};{d}m", .{ rgb.r, rgb.g, rgb.b }),
+                .none => try self.appendSgrParam(params_start, "49"),
+                .palette => |idx| try self.appendSgrParam(params_start, sgr_palette.bg256[idx]),
+                .rgb => |rgb| try self.appendSgrRgb(params_start, "48;2;", rgb),
             }
             self.current_bg = cell.bg;
         }
+
+        if (self.output.items.len == params_start) {
+            // Nothing changed - drop the unused CSI prefix
+            self.output.shrinkRetainingCapacity(seq_start);
+        } else {
+            try self.output.append(self.allocator, 'm');
+        }
+    }
+
+    /// Append one SGR parameter, ';'-separated from any earlier ones
+    fn appendSgrParam(self: *Renderer, params_start: usize, param: []const u8) !void {
+        if (self.output.items.len > params_start) try self.output.append(self.allocator, ';');
+        try self.output.appendSlice(self.allocator, param);
+    }
+
+    /// Append a truecolor SGR parameter, e.g. 38;2;r;g;b
+    fn appendSgrRgb(self: *Renderer, params_start: usize, comptime prefix: []const u8, rgb: Color.RGB) !void {
+        try self.appendSgrParam(params_start, prefix);
+        try appendDecimal(&self.output, self.allocator, rgb.r);
+        try self.output.append(self.allocator, ';');
+        try appendDecimal(&self.output, self.allocator, rgb.g);
+        try self.output.append(self.allocator, ';');
+        try appendDecimal(&self.output, self.allocator, rgb.b);
     }
 
     fn emitChar(self: *Renderer, char: u21) !void {
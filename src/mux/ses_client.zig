@@ -53,11 +53,16 @@ pub const SesClient = struct {
         try self.startSes();
         self.just_started_daemon = true;
 
-        // Wait for daemon to be ready
-        std.Thread.sleep(200 * std.time.ns_per_ms);
-
-        // Retry connection
-        const client = try core.ipc.Client.connect(socket_path);
+        // Wait for daemon to be ready: poll its socket instead of sleeping a
+        // fixed 200ms, so we connect as soon as it starts listening
+        var attempt: usize = 0;
+        const client = while (true) : (attempt += 1) {
+            if (core.ipc.Client.connect(socket_path)) |cl| break cl else |err| {
+                if (err != error.ConnectionRefused and err != error.FileNotFound) return err;
+                if (attempt >= 40) return err;
+            }
+            std.Thread.sleep(5 * std.time.ns_per_ms);
+        };
         self.conn = client.toConnection();
         try self.register();
     }
@@ -106,16 +111,7 @@ pub const SesClient = struct {
         writer.writeAll("{\"type\":\"sync_state\",\"mux_state\":\"") catch return error.WriteError;
 
         // Escape the JSON string
-        for (mux_state_json) |c| {
-            switch (c) {
-                '"' => writer.writeAll("\\\"") catch return error.WriteError,
-                '\\' => writer.writeAll("\\\\") catch return error.WriteError,
-                '\n' => writer.writeAll("\\n") catch return error.WriteError,
-                '\r' => writer.writeAll("\\r") catch return error.WriteError,
-                '\t' => writer.writeAll("\\t") catch return error.WriteError,
-                else => writer.writeByte(c) catch return error.WriteError,
-            }
-        }
+        core.ipc.writeJsonEscaped(writer, mux_state_json) catch return error.WriteError;
         writer.writeAll("\"}") catch return error.WriteError;
 
         try conn.sendLine(stream.getWritten());
@@ -556,16 +552,7 @@ pub const SesClient = struct {
         var writer = stream.writer();
         writer.print("{{\"type\":\"detach_session\",\"session_id\":\"{s}\",\"mux_state\":\"", .{session_id}) catch return error.WriteError;
         // Escape the JSON string
-        for (mux_state_json) |c| {
-            switch (c) {
-                '"' => writer.writeAll("\\\"") catch return error.WriteError,
-                '\\' => writer.writeAll("\\\\") catch return error.WriteError,
-                '\n' => writer.writeAll("\\n") catch return error.WriteError,
-                '\r' => writer.writeAll("\\r") catch return error.WriteError,
-                '\t' => writer.writeAll("\\t") catch return error.WriteError,
-                else => writer.writeByte(c) catch return error.WriteError,
-            }
-        }
+        core.ipc.writeJsonEscaped(writer, mux_state_json) catch return error.WriteError;
         writer.writeAll("\"}") catch return error.WriteError;
 
         try conn.sendLine(stream.getWritten());
@@ -109,9 +109,7 @@ pub fn draw(
     const cfg = &config.tabs.status;
 
     // Clear status bar
-    for (0..width) |xi| {
-        renderer.setCell(@intCast(xi), y, .{ .char = ' ' });
-    }
+    renderer.fillRect(0, y, width, 1, .{ .char = ' ' });
 
     // Create shp context
     var ctx = shp.Context.init(allocator);
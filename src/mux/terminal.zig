@@ -50,3 +50,28 @@ pub fn enableRawMode(fd: posix.fd_t) !posix.termios {
 pub fn disableRawMode(fd: posix.fd_t, orig: posix.termios) !void {
     try posix.tcsetattr(fd, .NOW, orig);
 }
+
+/// Set by SIGWINCH so the main loop only queries the size after a resize
+var resize_pending = std.atomic.Value(bool).init(true);
+
+fn handleSigwinch(sig: c_int) callconv(.c) void {
+    _ = sig;
+    resize_pending.store(true, .release);
+}
+
+/// Install the SIGWINCH handler that feeds `takeResize`.
+/// SA_RESTART keeps a resize from failing blocking calls such as the
+/// recvmsg/sendmsg used for pane fd passing.
+pub fn watchResize() void {
+    const winch_action = std.os.linux.Sigaction{
+        .handler = .{ .handler = handleSigwinch },
+        .mask = std.os.linux.sigemptyset(),
+        .flags = std.os.linux.SA.RESTART,
+    };
+    _ = std.os.linux.sigaction(posix.SIG.WINCH, &winch_action, null);
+}
+
+/// Returns true (once) if the terminal was resized since the last call
+pub fn takeResize() bool {
+    return resize_pending.swap(false, .acq_rel);
+}
@@ -243,16 +243,7 @@ pub fn handleStatus(
             if (client.last_mux_state) |mux_state| {
                 try writer.writeAll(",\"mux_state\":\"");
                 // Escape the mux state JSON string
-                for (mux_state) |c| {
-                    switch (c) {
-                        '"' => try writer.writeAll("\\\""),
-                        '\\' => try writer.writeAll("\\\\"),
-                        '\n' => try writer.writeAll("\\n"),
-                        '\r' => try writer.writeAll("\\r"),
-                        '\t' => try writer.writeAll("\\t"),
-                        else => try writer.writeByte(c),
-                    }
-                }
+                try ipc.writeJsonEscaped(writer, mux_state);
                 try writer.writeAll("\"");
             }
         }
@@ -278,16 +269,7 @@ pub fn handleStatus(
         if (full_mode) {
             try writer.writeAll(",\"mux_state\":\"");
             // Escape the mux state JSON string
-            for (detached.mux_state_json) |c| {
-                switch (c) {
-                    '"' => try writer.writeAll("\\\""),
-                    '\\' => try writer.writeAll("\\\\"),
-                    '\n' => try writer.writeAll("\\n"),
-                    '\r' => try writer.writeAll("\\r"),
-                    '\t' => try writer.writeAll("\\t"),
-                    else => try writer.writeByte(c),
-                }
-            }
+            try ipc.writeJsonEscaped(writer, detached.mux_state_json);
             try writer.writeAll("\"");
         }
         try writer.writeAll("}");
@@ -187,16 +187,7 @@ pub fn handleReattach(
 
     try writer.writeAll("{\"type\":\"session_reattached\",\"mux_state\":\"");
     // Escape the mux state JSON string (escape quotes and backslashes)
-    for (reattach_result.mux_state_json) |c| {
-        switch (c) {
-            '"' => try writer.writeAll("\\\""),
-            '\\' => try writer.writeAll("\\\\"),
-            '\n' => try writer.writeAll("\\n"),
-            '\r' => try writer.writeAll("\\r"),
-            '\t' => try writer.writeAll("\\t"),
-            else => try writer.writeByte(c),
-        }
-    }
+    try ipc.writeJsonEscaped(writer, reattach_result.mux_state_json);
     try writer.writeAll("\",\"panes\":[");
 
     for (reattach_result.pane_uuids, 0..) |uuid, i| {
@@ -3,6 +3,7 @@ const posix = std.posix;
 const segment = @import("segment.zig");
 const segments_mod = @import("segments/mod.zig");
 const Style = @import("style.zig").Style;
+const sgr_palette = @import("palette.zig");
 
 // JSON structures for config parsing
 const JsonOutput = struct {
@@ -255,23 +256,32 @@ fn renderPrompt(allocator: std.mem.Allocator, args: []const []const u8) !void {
     const config = loadConfig(allocator);
     defer if (config) |c| c.deinit();
 
-    if (config) |cfg| {
-        if (cfg.value.prompt) |prompt| {
-            const modules = if (is_right) prompt.right else prompt.left;
-            if (modules) |mods| {
-                if (mods.len > 0) {
-                    try renderModulesSimple(&ctx, mods, stdout, is_zsh);
-                    return;
+    // Build the whole prompt in memory and emit it with a single write
+    var out: std.ArrayList(u8) = .empty;
+    defer out.deinit(allocator);
+    const writer = out.writer(allocator);
+
+    rendered: {
+        if (config) |cfg| {
+            if (cfg.value.prompt) |prompt| {
+                const modules = if (is_right) prompt.right else prompt.left;
+                if (modules) |mods| {
+                    if (mods.len > 0) {
+                        try renderModulesSimple(&ctx, mods, writer, is_zsh);
+                        break :rendered;
+                    }
                 }
             }
         }
+
+        // Fallback to defaults if no config
+        try renderDefaultPrompt(&ctx, is_right, writer, is_zsh);
     }
 
-    // Fallback to defaults if no config
-    try renderDefaultPrompt(&ctx, is_right, stdout, is_zsh);
+    try stdout.writeAll(out.items);
 }
 
-fn renderDefaultPrompt(ctx: *segment.Context, is_right: bool, stdout: std.fs.File, is_zsh: bool) !void {
+fn renderDefaultPrompt(ctx: *segment.Context, is_right: bool, writer: anytype, is_zsh: bool) !void {
     _ = is_zsh;
     const segment_names: []const []const u8 = if (is_right)
         &.{"time"}
@@ -282,21 +292,23 @@ fn renderDefaultPrompt(ctx: *segment.Context, is_right: bool, stdout: std.fs.Fil
         if (ctx.renderSegment(name)) |segs| {
             for (segs) |seg| {
                 // Just write text directly - no styling for now
-                try stdout.writeAll(seg.text);
-                try stdout.writeAll(" ");
+                try writer.writeAll(seg.text);
+                try writer.writeAll(" ");
             }
         }
     }
 }
 
-fn writeSegment(stdout: std.fs.File, seg: segment.Segment, is_zsh: bool) !void {
-    try writeStyleDirect(stdout, seg.style, is_zsh);
-    try stdout.writeAll(seg.text);
-    if (!seg.style.isEmpty()) {
-        if (is_zsh) try stdout.writeAll("%{");
-        try stdout.writeAll("\x1b[0m");
-        if (is_zsh) try stdout.writeAll("%}");
-    }
+fn writeSegment(writer: anytype, seg: segment.Segment, is_zsh: bool) !void {
+    try writeStyleDirect(writer, seg.style, false, is_zsh);
+    try writer.writeAll(seg.text);
+    if (!seg.style.isEmpty()) try writeReset(writer, is_zsh);
+}
+
+fn writeReset(writer: anytype, is_zsh: bool) !void {
+    if (is_zsh) try writer.writeAll("%{");
+    try writer.writeAll("\x1b[0m");
+    if (is_zsh) try writer.writeAll("%}");
 }
 
 fn loadConfig(allocator: std.mem.Allocator) ?std.json.Parsed(JsonConfig) {
@@ -324,7 +336,7 @@ fn getConfigPath(allocator: std.mem.Allocator) ![]const u8 {
     return std.fmt.allocPrint(allocator, "{s}/.config/hexa/shp.json", .{home});
 }
 
-fn renderModulesSimple(ctx: *segment.Context, modules: []const JsonModule, stdout: std.fs.File, is_zsh: bool) !void {
+fn renderModulesSimple(ctx: *segment.Context, modules: []const JsonModule, writer: anytype, is_zsh: bool) !void {
     const alloc = std.heap.page_allocator;
 
     // Known built-in segments that return null when they have nothing to show
@@ -497,7 +509,11 @@ fn renderModulesSimple(ctx: *segment.Context, modules: []const JsonModule, stdou
         }
     }
 
-    // Render modules in original order, but only visible ones
+    // Render modules in original order, but only visible ones.
+    // A styled output leaves its attributes active; the next styled output
+    // folds the reset into its own SGR ("0;...") and only unstyled text or
+    // the end of the prompt needs a separate reset.
+    var pending_reset = false;
     for (modules[0..mod_count], 0..) |mod, i| {
         if (!results[i].should_render or !results[i].visible) continue;
 
@@ -508,17 +524,18 @@ fn renderModulesSimple(ctx: *segment.Context, modules: []const JsonModule, stdou
                 const style = Style.parse(out.style orelse "");
                 const format = out.format orelse "$output";
 
-                try writeStyleDirect(stdout, style, is_zsh);
-                try writeFormat(stdout, format, output_text);
-
-                if (!style.isEmpty()) {
-                    if (is_zsh) try stdout.writeAll("%{");
-                    try stdout.writeAll("\x1b[0m");
-                    if (is_zsh) try stdout.writeAll("%}");
+                if (style.isEmpty()) {
+                    if (pending_reset) try writeReset(writer, is_zsh);
+                    pending_reset = false;
+                } else {
+                    try writeStyleDirect(writer, style, pending_reset, is_zsh);
+                    pending_reset = true;
                 }
+                try writeFormat(writer, format, output_text);
             }
         }
     }
+    if (pending_reset) try writeReset(writer, is_zsh);
 }
 
 /// Calculate the visible width of a format string with $output substituted
@@ -567,10 +584,12 @@ fn runCommand(allocator: std.mem.Allocator, cmd: []const u8) ?[]const u8 {
     return output;
 }
 
-fn writeStyleDirect(stdout: std.fs.File, style: Style, is_zsh: bool) !void {
+/// Write the SGR sequence for a style. With reset_first the sequence starts
+/// with 0 so it also clears whatever the previous style left active.
+fn writeStyleDirect(writer: anytype, style: Style, reset_first: bool, is_zsh: bool) !void {
     if (style.isEmpty()) return;
 
-    if (is_zsh) try stdout.writeAll("%{");
+    if (is_zsh) try writer.writeAll("%{");
 
     // Build ANSI sequence
     var buf: [64]u8 = undefined;
@@ -582,7 +601,16 @@ fn writeStyleDirect(stdout: std.fs.File, style: Style, is_zsh: bool) !void {
 
     var need_semi = false;
 
+    if (reset_first) {
+        buf[len] = '0';
+        len += 1;
+        need_semi = true;
+    }
     if (style.bold) {
+        if (need_semi) {
+            buf[len] = ';';
+            len += 1;
+        }
         buf[len] = '1';
         len += 1;
         need_semi = true;
@@ -623,12 +651,8 @@ fn writeStyleDirect(stdout: std.fs.File, style: Style, is_zsh: bool) !void {
                 buf[len] = ';';
                 len += 1;
             }
-            const code = if (p < 8)
-                std.fmt.bufPrint(buf[len..], "{d}", .{30 + p}) catch ""
-            else if (p < 16)
-                std.fmt.bufPrint(buf[len..], "{d}", .{90 + p - 8}) catch ""
-            else
-                std.fmt.bufPrint(buf[len..], "38;5;{d}", .{p}) catch "";
+            const code = sgr_palette.fg_codes[p];
+            @memcpy(buf[len..][0..code.len], code);
             len += code.len;
             need_semi = true;
         },
@@ -651,12 +675,8 @@ fn writeStyleDirect(stdout: std.fs.File, style: Style, is_zsh: bool) !void {
                 buf[len] = ';';
                 len += 1;
             }
-            const code = if (p < 8)
-                std.fmt.bufPrint(buf[len..], "{d}", .{40 + p}) catch ""
-            else if (p < 16)
-                std.fmt.bufPrint(buf[len..], "{d}", .{100 + p - 8}) catch ""
-            else
-                std.fmt.bufPrint(buf[len..], "48;5;{d}", .{p}) catch "";
+            const code = sgr_palette.bg_codes[p];
+            @memcpy(buf[len..][0..code.len], code);
             len += code.len;
         },
         .rgb => |rgb| {
@@ -672,23 +692,19 @@ fn writeStyleDirect(stdout: std.fs.File, style: Style, is_zsh: bool) !void {
     buf[len] = 'm';
     len += 1;
 
-    try stdout.writeAll(buf[0..len]);
-    if (is_zsh) try stdout.writeAll("%}");
+    try writer.writeAll(buf[0..len]);
+    if (is_zsh) try writer.writeAll("%}");
 }
 
-fn writeFormat(stdout: std.fs.File, format: []const u8, output: []const u8) !void {
-    var i: usize = 0;
-    while (i < format.len) {
-        if (i + 7 <= format.len and std.mem.eql(u8, format[i..][0..7], "$output")) {
-            try stdout.writeAll(output);
-            i += 7;
-        } else {
-            const char_len = std.unicode.utf8ByteSequenceLength(format[i]) catch 1;
-            const end = @min(i + char_len, format.len);
-            try stdout.writeAll(format[i..end]);
-            i = end;
-        }
+fn writeFormat(writer: anytype, format: []const u8, output: []const u8) !void {
+    // Copy literal runs between $output placeholders in one go
+    var rest = format;
+    while (std.mem.indexOf(u8, rest, "$output")) |idx| {
+        try writer.writeAll(rest[0..idx]);
+        try writer.writeAll(output);
+        rest = rest[idx + 7 ..];
     }
+    try writer.writeAll(rest);
 }
 
 fn checkCondition(cmd: []const u8) bool {
@@ -705,3 +721,13 @@ fn checkCondition(cmd: []const u8) bool {
     };
 }
 
+test "consecutive styles fold the reset into the next SGR" {
+    var out: std.ArrayList(u8) = .empty;
+    defer out.deinit(std.testing.allocator);
+    const writer = out.writer(std.testing.allocator);
+
+    try writeStyleDirect(writer, Style.parse("bg:237"), false, false);
+    try writeStyleDirect(writer, Style.parse("bold fg:1"), true, false);
+    try writeStyleDirect(writer, Style.parse("fg:2"), true, true);
+    try std.testing.expectEqualStrings("\x1b[48;5;237m\x1b[0;1;31m%{\x1b[0;32m%}", out.items);
+}
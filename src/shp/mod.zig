@@ -2,6 +2,7 @@
 // Used by both mux status bar and shell prompt
 
 pub const style = @import("style.zig");
+pub const palette = @import("palette.zig");
 pub const format = @import("format.zig");
 pub const segment = @import("segment.zig");
 pub const segments = @import("segments/mod.zig");
@@ -0,0 +1,55 @@
+const std = @import("std");
+
+// Precomputed SGR parameters for the 256-color palette.
+// Shared by the shell prompt and the mux renderer so neither formats
+// palette colors at runtime.
+
+/// SGR parameters for each palette color: 30-37/90-97 for the 16 basic
+/// colors and 38;5;N above that (40-47/100-107/48;5;N for backgrounds)
+pub const fg_codes = codes(30, 90, "38;5;");
+pub const bg_codes = codes(40, 100, "48;5;");
+
+/// Indexed SGR parameters for every palette color: 38;5;N and 48;5;N.
+/// The mux renderer uses these so panes keep their exact indexed colors
+/// (terminals may brighten bold text only for the short 30-37 codes).
+pub const fg256 = indexed("38;5;");
+pub const bg256 = indexed("48;5;");
+
+fn codes(comptime base: u8, comptime bright_base: u8, comptime extended: []const u8) [256][]const u8 {
+    @setEvalBranchQuota(1_000_000);
+    var table: [256][]const u8 = undefined;
+    inline for (0..256) |i| {
+        table[i] = if (i < 8)
+            std.fmt.comptimePrint("{d}", .{base + i})
+        else if (i < 16)
+            std.fmt.comptimePrint("{d}", .{bright_base + i - 8})
+        else
+            std.fmt.comptimePrint(extended ++ "{d}", .{i});
+    }
+    return table;
+}
+
+fn indexed(comptime prefix: []const u8) [256][]const u8 {
+    @setEvalBranchQuota(1_000_000);
+    var table: [256][]const u8 = undefined;
+    inline for (0..256) |i| {
+        table[i] = std.fmt.comptimePrint(prefix ++ "{d}", .{i});
+    }
+    return table;
+}
+
+test "palette codes" {
+    try std.testing.expectEqualStrings("31", fg_codes[1]);
+    try std.testing.expectEqualStrings("97", fg_codes[15]);
+    try std.testing.expectEqualStrings("38;5;237", fg_codes[237]);
+    try std.testing.expectEqualStrings("40", bg_codes[0]);
+    try std.testing.expectEqualStrings("101", bg_codes[9]);
+    try std.testing.expectEqualStrings("48;5;16", bg_codes[16]);
+}
+
+test "palette indexed codes" {
+    try std.testing.expectEqualStrings("38;5;1", fg256[1]);
+    try std.testing.expectEqualStrings("38;5;255", fg256[255]);
+    try std.testing.expectEqualStrings("48;5;0", bg256[0]);
+    try std.testing.expectEqualStrings("48;5;237", bg256[237]);
+}
@@ -10,6 +10,24 @@ pub const Segment = struct {
 /// Segment render function signature
 pub const SegmentFn = *const fn (ctx: *Context) ?[]const Segment;
 
+/// Dynamic segments (cpu, mem, netspeed, time) should not be cached
+/// since they need fresh values each render
+const dynamic_segments = std.StaticStringMap(void).initComptime(.{
+    .{"cpu"},
+    .{"mem"},
+    .{"memory"},
+    .{"netspeed"},
+    .{"time"},
+    .{"battery"},
+    .{"uptime"},
+});
+
+/// Fixed tab styles for the mux status bar, built once instead of
+/// re-parsing the same style strings for every tab on every render
+const tab_separator_style = Style{ .fg = .{ .palette = 7 } }; // "fg:7"
+const tab_active_style = Style{ .fg = .{ .palette = 0 }, .bg = .{ .palette = 1 } }; // "bg:1 fg:0"
+const tab_inactive_style = Style{ .fg = .{ .palette = 250 }, .bg = .{ .palette = 237 } }; // "bg:237 fg:250"
+
 /// Context passed to all segments during rendering
 pub const Context = struct {
     allocator: std.mem.Allocator,
@@ -57,16 +75,7 @@ pub const Context = struct {
 
     /// Render a segment by name and return its segments
     pub fn renderSegment(self: *Context, name: []const u8) ?[]const Segment {
-        // Dynamic segments (cpu, mem, netspeed, time) should not be cached
-        // since they need fresh values each render
-        const dynamic_segments = [_][]const u8{ "cpu", "mem", "memory", "netspeed", "time", "battery", "uptime" };
-        var is_dynamic = false;
-        for (dynamic_segments) |dyn| {
-            if (std.mem.eql(u8, name, dyn)) {
-                is_dynamic = true;
-                break;
-            }
-        }
+        const is_dynamic = dynamic_segments.has(name);
 
         // Check cache first (only for non-dynamic segments)
         if (!is_dynamic) {
@@ -117,15 +126,12 @@ pub const Context = struct {
             if (i > 0) {
                 self.segment_buffer.append(self.allocator, .{
                     .text = " | ",
-                    .style = Style.parse("fg:7"),
+                    .style = tab_separator_style,
                 }) catch return null;
             }
 
             // Add tab name with active/inactive styling
-            const style = if (is_active)
-                Style.parse("bg:1 fg:0")
-            else
-                Style.parse("bg:237 fg:250");
+            const style = if (is_active) tab_active_style else tab_inactive_style;
 
             self.segment_buffer.append(self.allocator, .{
                 .text = tab_name,
@@ -1,4 +1,5 @@
 const std = @import("std");
+const sgr_palette = @import("palette.zig");
 
 /// Color representation - compatible with mux/render.zig Color
 pub const Color = union(enum) {
@@ -78,15 +79,7 @@ pub const Color = union(enum) {
     pub fn toAnsiFg(self: Color, writer: anytype) !void {
         switch (self) {
             .none => try writer.writeAll("\x1b[39m"),
-            .palette => |idx| {
-                if (idx < 8) {
-                    try writer.print("\x1b[{d}m", .{30 + idx});
-                } else if (idx < 16) {
-                    try writer.print("\x1b[{d}m", .{90 + idx - 8});
-                } else {
-                    try writer.print("\x1b[38;5;{d}m", .{idx});
-                }
-            },
+            .palette => |idx| try writer.print("\x1b[{s}m", .{sgr_palette.fg_codes[idx]}),
             .rgb => |rgb| try writer.print("\x1b[38;2;{d};{d};{d}m", .{ rgb.r, rgb.g, rgb.b }),
         }
     }
@@ -95,15 +88,7 @@ pub const Color = union(enum) {
     pub fn toAnsiBg(self: Color, writer: anytype) !void {
         switch (self) {
             .none => try writer.writeAll("\x1b[49m"),
-            .palette => |idx| {
-                if (idx < 8) {
-                    try writer.print("\x1b[{d}m", .{40 + idx});
-                } else if (idx < 16) {
-                    try writer.print("\x1b[{d}m", .{100 + idx - 8});
-                } else {
-                    try writer.print("\x1b[48;5;{d}m", .{idx});
-                }
-            },
+            .palette => |idx| try writer.print("\x1b[{s}m", .{sgr_palette.bg_codes[idx]}),
             .rgb => |rgb| try writer.print("\x1b[48;2;{d};{d};{d}m", .{ rgb.r, rgb.g, rgb.b }),
         }
     }